@@ -0,0 +1,224 @@
+"""
+Optional Numba JIT kernels for the historical-feature computations.
+
+The expanding "past only" statistics in data_processing walk a pre-sorted
+array once, keeping a running sum / sum-of-squares / count per dense group
+code. That single pass is a perfect fit for a JIT kernel: no pandas window
+objects, no per-group Python dispatch, output written in place.
+
+Numba is OPTIONAL: when it is not installed, data_processing falls back to
+the vectorized cumsum path and everything still works.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # numba not installed - fall back to pure pandas/numpy
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so this module imports cleanly without numba."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def expanding_mean_std(codes, values, out_mean, out_std):
+    """
+    Expanding mean and std (ddof=0) over PAST rows only, per group.
+
+    Args:
+        codes: dense int64 group codes (e.g. from pd.factorize), in the
+               time order the expanding window should follow
+        values: float64 values aligned with codes; NaN entries are skipped
+        out_mean, out_std: preallocated float64 output arrays (written in place)
+
+    For each row i the outputs describe the non-NaN values of rows BEFORE i
+    within the same group (NaN when the group has no history yet), matching
+    expanding().mean().shift(1) / expanding().std(ddof=0).shift(1).
+
+    Mean and variance are carried together with Welford's algorithm: one
+    running mean and M2 (sum of squared deviations) per group, updated in
+    the same pass. That fuses the mean and std work and avoids the
+    cancellation-prone E[x^2] - E[x]^2 identity.
+    """
+    n = codes.shape[0]
+    ngroups = 0
+    for i in range(n):
+        if codes[i] + 1 > ngroups:
+            ngroups = codes[i] + 1
+
+    means = np.zeros(ngroups, dtype=np.float64)
+    m2s = np.zeros(ngroups, dtype=np.float64)
+    cnts = np.zeros(ngroups, dtype=np.int64)
+
+    for i in range(n):
+        g = codes[i]
+        if cnts[g] > 0:
+            out_mean[i] = means[g]
+            out_std[i] = np.sqrt(m2s[g] / cnts[g])
+        else:
+            out_mean[i] = np.nan
+            out_std[i] = np.nan
+
+        v = values[i]
+        if not np.isnan(v):
+            cnts[g] += 1
+            d = v - means[g]
+            means[g] += d / cnts[g]
+            m2s[g] += d * (v - means[g])
+
+
+@njit(cache=True)
+def fused_past_stats(
+    driver_codes,
+    cons_codes,
+    race_ids,
+    points,
+    positions,
+    d_races,
+    d_avg_pts,
+    d_consistency,
+    c_races,
+    c_strength,
+    c_avg_finish,
+):
+    """
+    One pass over the time-sorted rows computing BOTH driver and constructor
+    past features, replacing three separate groupby passes plus a merge.
+
+    Driver stats are simple expanding accumulators per driver code.
+
+    Constructor stats must be race-level (two teammates per race must not
+    leak into each other), so each constructor keeps a "pending race"
+    accumulator: rows of one race are contiguous after the time sort, and
+    the pending totals are folded into the constructor's history as soon as
+    a row from a LATER race shows up. Outputs for a row therefore only ever
+    describe races strictly before that row's race.
+
+    All out_* arrays are preallocated by the caller and written in place.
+    """
+    n = driver_codes.shape[0]
+    nd = 0
+    nc = 0
+    for i in range(n):
+        if driver_codes[i] + 1 > nd:
+            nd = driver_codes[i] + 1
+        if cons_codes[i] + 1 > nc:
+            nc = cons_codes[i] + 1
+
+    # Driver accumulators
+    d_rows = np.zeros(nd, dtype=np.int64)       # all rows seen (cumcount)
+    d_pts_sum = np.zeros(nd, dtype=np.float64)
+    d_pts_cnt = np.zeros(nd, dtype=np.int64)
+    # Welford accumulators for finish-position consistency (running mean
+    # and M2 = sum of squared deviations; stable, no sum-of-squares)
+    d_pos_mean = np.zeros(nd, dtype=np.float64)
+    d_pos_m2 = np.zeros(nd, dtype=np.float64)
+    d_pos_cnt = np.zeros(nd, dtype=np.int64)
+
+    # Constructor history (completed races only)
+    h_races = np.zeros(nc, dtype=np.int64)
+    h_pts_sum = np.zeros(nc, dtype=np.float64)
+    h_fin_sum = np.zeros(nc, dtype=np.float64)  # sum of per-race mean finishes
+    h_fin_races = np.zeros(nc, dtype=np.int64)
+
+    # Constructor pending-race accumulators
+    pend_race = np.full(nc, -1, dtype=np.int64)
+    pend_pts = np.zeros(nc, dtype=np.float64)
+    pend_fin_sum = np.zeros(nc, dtype=np.float64)
+    pend_fin_cnt = np.zeros(nc, dtype=np.int64)
+
+    for i in range(n):
+        # ----- driver side -----
+        g = driver_codes[i]
+        d_races[i] = d_rows[g]
+        d_rows[g] += 1
+
+        if d_pts_cnt[g] > 0:
+            d_avg_pts[i] = d_pts_sum[g] / d_pts_cnt[g]
+        else:
+            d_avg_pts[i] = np.nan
+        if d_pos_cnt[g] > 0:
+            d_consistency[i] = np.sqrt(d_pos_m2[g] / d_pos_cnt[g])
+        else:
+            d_consistency[i] = np.nan
+
+        p = points[i]
+        if not np.isnan(p):
+            d_pts_sum[g] += p
+            d_pts_cnt[g] += 1
+        pos = positions[i]
+        if not np.isnan(pos):
+            d_pos_cnt[g] += 1
+            d = pos - d_pos_mean[g]
+            d_pos_mean[g] += d / d_pos_cnt[g]
+            d_pos_m2[g] += d * (pos - d_pos_mean[g])
+
+        # ----- constructor side -----
+        c = cons_codes[i]
+        r = race_ids[i]
+        if pend_race[c] != r:
+            if pend_race[c] != -1:
+                # fold the finished race into the constructor's history
+                h_races[c] += 1
+                h_pts_sum[c] += pend_pts[c]
+                if pend_fin_cnt[c] > 0:
+                    h_fin_sum[c] += pend_fin_sum[c] / pend_fin_cnt[c]
+                    h_fin_races[c] += 1
+            pend_race[c] = r
+            pend_pts[c] = 0.0
+            pend_fin_sum[c] = 0.0
+            pend_fin_cnt[c] = 0
+
+        c_races[i] = h_races[c]
+        if h_races[c] > 0:
+            c_strength[i] = h_pts_sum[c] / h_races[c]
+        else:
+            c_strength[i] = np.nan
+        if h_fin_races[c] > 0:
+            c_avg_finish[i] = h_fin_sum[c] / h_fin_races[c]
+        else:
+            c_avg_finish[i] = np.nan
+
+        if not np.isnan(p):
+            pend_pts[c] += p
+        if not np.isnan(pos):
+            pend_fin_sum[c] += pos
+            pend_fin_cnt[c] += 1
+
+
+if HAS_NUMBA:
+    # Pre-warm both kernels at import with tiny arrays in the exact dtypes
+    # the call sites use (int64 codes, float64 values). Combined with
+    # cache=True this means the first real pipeline call never pays the
+    # JIT compile cost - later Python processes load the on-disk cache.
+    try:
+        _codes = np.zeros(1, dtype=np.int64)
+        _vals = np.zeros(1, dtype=np.float64)
+        expanding_mean_std(
+            _codes, _vals, np.empty(1, np.float64), np.empty(1, np.float64)
+        )
+        fused_past_stats(
+            _codes,
+            _codes,
+            _codes,
+            _vals,
+            _vals,
+            np.empty(1, np.int64),
+            np.empty(1, np.float64),
+            np.empty(1, np.float64),
+            np.empty(1, np.int64),
+            np.empty(1, np.float64),
+            np.empty(1, np.float64),
+        )
+    except Exception:
+        # Warm-up is best-effort; never let it break the import
+        pass
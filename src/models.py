@@ -14,6 +14,7 @@ from typing import Dict, List, Tuple
 import numpy as np
 import pandas as pd
 
+from joblib import Parallel, delayed
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
@@ -32,7 +33,9 @@ def build_preprocessor(numeric_features: List[str], categorical_features: List[s
 
     categorical_pipe = Pipeline(steps=[
         ("imputer", SimpleImputer(strategy="most_frequent")),
-        ("onehot", OneHotEncoder(handle_unknown="ignore")),
+        # sparse float32: high-cardinality ids (drivers, constructors) stay
+        # compact instead of exploding into dense float64 columns
+        ("onehot", OneHotEncoder(handle_unknown="ignore", sparse_output=True, dtype=np.float32)),
     ])
 
     preprocessor = ColumnTransformer(
@@ -69,6 +72,12 @@ def evaluate_regression(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, flo
 
 
 
+def _fit_and_predict(model, X_train, y_train, X_test):
+    """Worker for the parallel fit: returns the fitted model and its test predictions."""
+    model.fit(X_train, y_train)
+    return model, model.predict(X_test)
+
+
 def train_and_evaluate_models(
     models: Dict[str, Pipeline],
     X_train: pd.DataFrame,
@@ -76,15 +85,52 @@ def train_and_evaluate_models(
     X_test: pd.DataFrame,
     y_test: pd.Series,
 ) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
-    """Fit all models, evaluate, return results table and predictions."""
+    """
+    Fit all models, evaluate, return results table and predictions.
+
+    All pipelines from make_models() share an identical "preprocess" step,
+    so the preprocessing is fitted ONCE on the training data and the
+    transformed matrices are reused for every model - encoding the same
+    frame again per model is pure rework. The fitted preprocessor is put
+    back into each pipeline so pipe.predict() keeps working on raw frames.
+    """
     rows = []
     preds: Dict[str, np.ndarray] = {}
 
     y_test_arr = y_test.to_numpy()
 
+    pre = None
+    X_train_t = X_test_t = None
+
+    # Stage the fit jobs: pipelines whose "preprocess" step IS the shared
+    # preprocessor object get the already-transformed matrices; a pipeline
+    # with a differently configured preprocessor (same step name, different
+    # object) is fitted whole on the raw frames like any other estimator
+    jobs = []
     for name, pipe in models.items():
-        pipe.fit(X_train, y_train)
-        y_pred = pipe.predict(X_test)
+        if isinstance(pipe, Pipeline) and "preprocess" in pipe.named_steps:
+            if pre is None:
+                pre = pipe.named_steps["preprocess"]
+                X_train_t = pre.fit_transform(X_train, y_train)
+                X_test_t = pre.transform(X_test)
+            if pipe.named_steps["preprocess"] is pre:
+                jobs.append((name, pipe, pipe.steps[-1][1], X_train_t, X_test_t))
+                continue
+        jobs.append((name, None, pipe, X_train, X_test))
+
+    # The models are independent, so fit them in parallel workers
+    fitted = Parallel(n_jobs=-1)(
+        delayed(_fit_and_predict)(est, X_tr, y_train, X_te)
+        for (_name, _pipe, est, X_tr, X_te) in jobs
+    )
+
+    for (name, pipe, _est, _X_tr, _X_te), (fitted_est, y_pred) in zip(jobs, fitted):
+        if pipe is not None:
+            # put the fitted pieces back so pipe.predict() on raw frames works
+            pipe.steps[0] = ("preprocess", pre)
+            pipe.steps[-1] = (pipe.steps[-1][0], fitted_est)
+        else:
+            models[name] = fitted_est
         preds[name] = y_pred
 
         metrics = evaluate_regression(y_test_arr, y_pred)
@@ -125,29 +171,31 @@ def time_based_split(
     if year_col not in df.columns:
         raise KeyError(f"'{year_col}' column not found in df. Available: {list(df.columns)}")
 
-    tmp = df.copy()
-    tmp[year_col] = pd.to_numeric(tmp[year_col], errors="coerce").astype("Int64")
+    # One pass to build the row masks - no frame copy, no dropna temporaries
+    year = pd.to_numeric(df[year_col], errors="coerce").to_numpy(
+        dtype="float64", na_value=np.nan
+    )
 
     # keep only rows where year is valid + required columns exist
-    needed = feature_cols + [target_col, year_col]
-    tmp = tmp.dropna(subset=needed)
-
-    train_mask = tmp[year_col].between(train_years[0], train_years[1])
-    test_mask = tmp[year_col].between(test_years[0], test_years[1])
+    needed = feature_cols + [target_col]
+    ok = ~np.isnan(year) & df[needed].notna().all(axis=1).to_numpy()
 
-    train_df = tmp.loc[train_mask]
-    test_df = tmp.loc[test_mask]
+    train_mask = ok & (year >= train_years[0]) & (year <= train_years[1])
+    test_mask = ok & (year >= test_years[0]) & (year <= test_years[1])
 
-    if train_df.empty or test_df.empty:
+    n_train = int(train_mask.sum())
+    n_test = int(test_mask.sum())
+    if n_train == 0 or n_test == 0:
         raise ValueError(
             f"Time split produced empty set. "
-            f"Train rows: {len(train_df)}, Test rows: {len(test_df)}. "
+            f"Train rows: {n_train}, Test rows: {n_test}. "
             f"Check your year range or year column values."
         )
 
-    X_train = train_df[feature_cols].copy()
-    y_train = train_df[target_col].copy()
-    X_test = test_df[feature_cols].copy()
-    y_test = test_df[target_col].copy()
+    # No .copy(): sklearn never mutates its inputs
+    X_train = df.loc[train_mask, feature_cols]
+    y_train = df.loc[train_mask, target_col]
+    X_test = df.loc[test_mask, feature_cols]
+    y_test = df.loc[test_mask, target_col]
 
     return X_train, X_test, y_train, y_test
@@ -1,6 +1,11 @@
 # visualization_helpers for notebook 3(EDA).
 from __future__ import annotations
 
+import os
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple
 
@@ -8,6 +13,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+from matplotlib.collections import PathCollection
+from matplotlib.markers import MarkerStyle
 
 #Official F1 color palette
 F1_RED = "#FF1801"
@@ -20,19 +27,171 @@ plt.rcParams['axes.facecolor'] = 'white'
 plt.rcParams['grid.color'] = '#f0f0f0'
 plt.rcParams['font.family'] = 'sans-serif'
 
+#built once at import - LinearSegmentedColormap construction is not free
+#and the plots otherwise rebuild the same ramps on every call
+F1_CMAP = mcolors.LinearSegmentedColormap.from_list("f1_heatmap", [F1_DARK, F1_WHITE, F1_RED])
+F1_DENSITY_CMAP = mcolors.LinearSegmentedColormap.from_list("f1_density", [F1_WHITE, F1_RED])
+
+@lru_cache(maxsize=None)
 def ensure_fig_dir(project_root: Path) -> Path:
     #ensure reports and figures exists and return the directory path
+    #(cached: one mkdir syscall per root, not one per figure)
     fig_dir = project_root / "reports" / "figures"
     fig_dir.mkdir(parents=True, exist_ok=True)
     return fig_dir
 
-def save_fig(fig: plt.Figure, fig_dir: Path, filename: str, dpi: int = 150) -> Path:
+def save_fig(fig: plt.Figure, fig_dir: Path, filename: str, dpi: int = 150,
+             raster_dpi: Optional[int] = None, keep_open: bool = False,
+             reuse: bool = False) -> Path:
     #save figure and return saved path
+    #raster_dpi controls how finely rasterized artists (scatter clouds) are
+    #rendered while text/axes stay vector-crisp
+    #figures are created with layout="constrained", so no tight_layout()
+    #pass here and no bbox_inches="tight" (which renders the figure twice
+    #to measure the bounding box)
     out_path = fig_dir / filename
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=dpi, bbox_inches="tight")
+    #hand savefig a 1 MiB-buffered handle so the PNG encoder's many small
+    #writes coalesce into a few large syscalls
+    with open(out_path, "wb", buffering=1 << 20) as fh:
+        fig.savefig(fh, format=out_path.suffix.lstrip("."),
+                    dpi=raster_dpi if raster_dpi is not None else dpi)
+    #closed by default: pyplot keeps every figure alive otherwise, and a
+    #full EDA run would pin a dozen rendered canvases in memory.
+    #keep_open=True is for callers that still want the inline display;
+    #reuse=True pairs with reusable_figure, which keeps the canvas around
+    if not (keep_open or reuse):
+        plt.close(fig)
+    return out_path
+
+#one cached Figure per figsize for batch plotting: Figure + Agg canvas
+#construction is a real slice of savefig time for small plots, and a
+#reused canvas pays it once. Pair with save_fig(..., reuse=True)
+_FIG_CACHE: dict = {}
+
+@contextmanager
+def reusable_figure(figsize: Tuple[float, float]):
+    #yield a (fig, ax) pair backed by a cached figure of this size, with
+    #the axes cleared; the figure is never closed between uses
+    key = tuple(figsize)
+    fig = _FIG_CACHE.get(key)
+    if fig is None or not fig.axes:
+        fig = plt.figure(figsize=figsize, layout="constrained")
+        fig.add_subplot()
+        _FIG_CACHE[key] = fig
+    ax = fig.axes[0]
+    ax.cla()
+    yield fig, ax
+
+#lazily-started pool for save_fig_async; figures are shipped to the worker
+#by pickle, so the notebook process never blocks on PNG encoding
+_SAVE_POOL: Optional[ProcessPoolExecutor] = None
+
+def _worker_save(fig: plt.Figure, out_path: Path, dpi: int) -> Path:
+    #runs in a worker process on the unpickled figure; close it afterwards,
+    #since unpickling re-registers it with the worker's pyplot and the
+    #long-lived pool would otherwise hold one open figure per save
+    fig.savefig(out_path, dpi=dpi)
+    plt.close(fig)
     return out_path
 
+def _save_pool() -> ProcessPoolExecutor:
+    global _SAVE_POOL
+    if _SAVE_POOL is None:
+        _SAVE_POOL = ProcessPoolExecutor(max_workers=2)
+    return _SAVE_POOL
+
+def save_fig_async(fig: plt.Figure, fig_dir: Path, filename: str, dpi: int = 150,
+                   raster_dpi: Optional[int] = None) -> "Future[Path]":
+    #queue the save in a background process so plotting code keeps running;
+    #result() of the returned Future is the saved path.
+    #SMOOTH_OP_SINGLECORE=1 forces the save inline (debugging, small machines)
+    if os.environ.get("SMOOTH_OP_SINGLECORE") == "1":
+        done: "Future[Path]" = Future()
+        done.set_result(save_fig(fig, fig_dir, filename, dpi=dpi, raster_dpi=raster_dpi))
+        return done
+    out_path = fig_dir / filename
+    return _save_pool().submit(
+        _worker_save, fig, out_path, raster_dpi if raster_dpi is not None else dpi
+    )
+
+#above this many rows a scatter is pure overplotting - switch to a heatmap
+DENSE_SCATTER_THRESHOLD = 5000
+
+def _dense_scatter(ax: plt.Axes, x, y, bins: Tuple[int, int] = (60, 40)) -> None:
+    #2-D histogram rendered with one imshow: O(N) bin fill instead of
+    #stroking N overlapping markers, and the density is actually readable
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    ok = ~(np.isnan(x) | np.isnan(y))
+    H, xe, ye = np.histogram2d(x[ok], y[ok], bins=bins)
+    ax.imshow(H.T, origin="lower", extent=[xe[0], xe[-1], ye[0], ye[-1]],
+              aspect="auto", cmap=F1_DENSITY_CMAP)
+
+#narrow dtypes for the columns every plot re-reads; grid_clean keeps NaN
+#for missing grids so it narrows to float32 rather than int16
+_VIZ_DTYPES = {
+    "grid_clean": "float32",
+    "points": "float32",
+    "positionOrder": "int16",
+    "year": "int16",
+    "constructor_strength_past": "float32",
+    "driver_consistency_past": "float32",
+}
+
+def downcast_for_viz(df: pd.DataFrame) -> pd.DataFrame:
+    #downcast the plot columns once so every helper reads half-width
+    #arrays instead of re-materializing float64 copies per call.
+    #Returns df unchanged when everything is already narrow
+    todo = {}
+    for c, t in _VIZ_DTYPES.items():
+        if c not in df.columns:
+            continue
+        #pipeline output carries nullable ints (coerce_schema turns bad
+        #values into NA); an NA-holding column cannot become a plain int,
+        #so it falls back to NaN-capable float32
+        if df[c].hasnans and not t.startswith("float"):
+            t = "float32"
+        if df[c].dtype != t:
+            todo[c] = t
+    if not todo:
+        return df
+    return df.assign(**{c: df[c].astype(t) for c, t in todo.items()})
+
+#one circle path shared by every point; ax.scatter builds per-point
+#transform work that a PathCollection with offsets skips entirely
+_MARKER_PATH = MarkerStyle("o").get_path().transformed(MarkerStyle("o").get_transform())
+
+def _fast_scatter(ax: plt.Axes, x, y, color=F1_RED, alpha: float = 0.3, s: float = 40) -> None:
+    #same look as ax.scatter(..., edgecolors="white"), drawn as a single
+    #collection: one marker path broadcast over an offsets array
+    pc = PathCollection(
+        [_MARKER_PATH],
+        sizes=[s],
+        offsets=np.column_stack([x, y]),
+        offset_transform=ax.transData,
+        facecolors=color,
+        edgecolors="white",
+        linewidths=0.5,
+        alpha=alpha,
+        rasterized=True,
+    )
+    ax.add_collection(pc)
+    ax.autoscale_view()
+
+def categorize(
+    df: pd.DataFrame,
+    cols: Sequence[str] = ("constructorName", "driverName", "name", "raceName"),
+) -> pd.DataFrame:
+    #convert the usual EDA group columns to category dtype once, up front:
+    #every groupby in this module then hashes small integer codes instead of
+    #re-hashing the same name strings per plot. Returns df unchanged when
+    #nothing needs converting
+    todo = [c for c in cols
+            if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not todo:
+        return df
+    return df.assign(**{c: df[c].astype("category") for c in todo})
+
 def plot_points_distribution(
         #this function plots the distribution of points. 
         #most drivers score 0 points(right-skewed distribution), 
@@ -41,9 +200,16 @@ def plot_points_distribution(
     fig_dir: Path,
     filename: str = "eda_points_hist.png",
 ) -> Path:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    ax.hist(df["points"].dropna(), bins=30, color=F1_RED, edgecolor='white', linewidth=0.5)
+    #bin in numpy and draw one bar call: no dropna temporary Series and no
+    #per-patch histogram work inside matplotlib
+    arr = df["points"].to_numpy(dtype=float)
+    arr = arr[~np.isnan(arr)]
+    counts, edges = np.histogram(arr, bins=30)
+
+    fig, ax = plt.subplots(figsize=(10, 4), layout="constrained")
+
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color=F1_RED, edgecolor='white', linewidth=0.5)
     ax.set_title("Distribution of Race Points", fontweight='bold', loc='left')
     ax.set_xlabel("Points")
     ax.set_ylabel("Count")
@@ -55,14 +221,27 @@ def plot_avg_points_by_year(
     fig_dir: Path,
     filename: str = "eda_avg_points_by_year_line.png",
 ) -> Path:
-    tmp = df.groupby("year", as_index=False)["points"].mean()
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    ax.plot(tmp["year"], tmp["points"], marker="o", color=F1_RED, linewidth=3, markersize=8, markerfacecolor=F1_DARK)
+    #years form a tiny dense integer range, so two np.bincount calls
+    #(sums and counts, indexed by year - min) beat a hash-based groupby
+    yr = pd.to_numeric(df["year"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    pts = df["points"].to_numpy(dtype="float64")
+    ok = ~np.isnan(yr) & ~np.isnan(pts)
+    yr_i = yr[ok].astype(np.int64)
+    base = int(yr_i.min())
+    idx = yr_i - base
+    sums = np.bincount(idx, weights=pts[ok])
+    cnts = np.bincount(idx)
+    present = cnts > 0
+    years = base + np.nonzero(present)[0]
+    avgs = sums[present] / cnts[present]
+
+    fig, ax = plt.subplots(figsize=(10, 4), layout="constrained")
+
+    ax.plot(years, avgs, marker="o", color=F1_RED, linewidth=3, markersize=8, markerfacecolor=F1_DARK)
     ax.set_title("Average Points per Driver-Race by Year (2018–2024)", fontweight='bold', loc='left')
     ax.set_xlabel("Year")
     ax.set_ylabel("Average Points")
-    ax.set_xticks(sorted(tmp["year"].unique()))
+    ax.set_xticks(years)
     ax.grid(True, alpha=0.3, linestyle='--')
     return save_fig(fig, fig_dir, filename)
 
@@ -71,11 +250,15 @@ def plot_qualifying_vs_points_scatter(
     fig_dir: Path,
     filename: str = "eda_grid_vs_points_scatter.png",
 ) -> Path:
-    fig, ax = plt.subplots(figsize=(10, 5))
-    x = df["grid_clean"].astype(float)
-    y = df["points"].astype(float)
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
+    #no float64 recast - after downcast_for_viz these are already narrow
+    x = df["grid_clean"].to_numpy()
+    y = df["points"].to_numpy()
     
-    ax.scatter(x, y, alpha=0.3, s=40, color=F1_RED, edgecolors='white', linewidth=0.5)
+    if len(x) > DENSE_SCATTER_THRESHOLD:
+        _dense_scatter(ax, x, y)
+    else:
+        _fast_scatter(ax, x, y)
     ax.set_title("Qualifying Position vs Race Points", fontweight='bold', loc='left')
     ax.set_xlabel("Qualifying Position (grid_clean)")
     ax.set_ylabel("Points")
@@ -91,30 +274,38 @@ def plot_points_by_grid_bucket_boxplot(
     fig_dir: Path,
     filename: str = "eda_points_by_grid_bucket_boxplot.png",
 ) -> Path:
-    def bucket(g: float) -> str:
-        if pd.isna(g):
-            return "Unknown"
-        g = int(g)
-        if 1 <= g <= 3:
-            return "P1-3"
-        if 4 <= g <= 10:
-            return "P4-10"
-        return "P11-20"
-
-    tmp = df.copy()
-    tmp["grid_bucket"] = tmp["grid_clean"].apply(bucket)
     order = ["P1-3", "P4-10", "P11-20"]
-    groups = [tmp.loc[tmp["grid_bucket"] == o, "points"].dropna().values for o in order]
+    #pd.cut bins every row in one vectorized pass - no frame copy and no
+    #per-row Python bucket() calls
+    buckets = pd.cut(df["grid_clean"], bins=[0, 3, 10, 20],
+                     labels=order, include_lowest=True)
+    groups = [df.loc[buckets == o, "points"].dropna().values for o in order]
+
+    fig, ax = plt.subplots(figsize=(8, 5), layout="constrained")
+
+    #showfliers=False: matplotlib draws every flier as its own artist, and
+    #the back-of-grid bucket has thousands of zero-point outliers. The
+    #comeback-drive story is kept by overplotting a capped subsample below
+    bplot = ax.boxplot(groups, tick_labels=order, showfliers=False, patch_artist=True)
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    bplot = ax.boxplot(groups, labels=order, showfliers=True, patch_artist=True)
-    
     for box in bplot['boxes']:
         box.set(facecolor=F1_RED, color=F1_DARK, linewidth=1.5)
     for median in bplot['medians']:
         median.set(color=F1_DARK, linewidth=2)
-        
+
+    rng = np.random.default_rng(0)
+    for i, g in enumerate(groups, start=1):
+        if g.size == 0:
+            continue
+        q1, q3 = np.quantile(g, [0.25, 0.75])
+        iqr = q3 - q1
+        fliers = g[(g < q1 - 1.5 * iqr) | (g > q3 + 1.5 * iqr)]
+        if fliers.size > 50:
+            fliers = rng.choice(fliers, 50, replace=False)
+        if fliers.size:
+            ax.plot(np.full(fliers.size, i), fliers, linestyle="none", marker="o",
+                    markersize=4, markerfacecolor=F1_RED, markeredgecolor=F1_DARK, alpha=0.5)
+
     ax.set_title("Points by Qualifying Bucket", fontweight='bold', loc='left')
     ax.set_xlabel("Grid Bucket")
     ax.set_ylabel("Points")
@@ -132,10 +323,13 @@ def plot_constructor_strength_vs_points(
     fig_dir: Path,
     filename: str = "eda_constructor_strength_vs_points.png",
 ) -> Path:
-    fig, ax = plt.subplots(figsize=(10, 5))
-    x = df["constructor_strength_past"].astype(float)
-    y = df["points"].astype(float)
-    ax.scatter(x, y, alpha=0.3, s=40, color=F1_RED, edgecolors='white', linewidth=0.5)
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
+    x = df["constructor_strength_past"].to_numpy()
+    y = df["points"].to_numpy()
+    if len(x) > DENSE_SCATTER_THRESHOLD:
+        _dense_scatter(ax, x, y)
+    else:
+        _fast_scatter(ax, x, y)
     ax.set_title("Constructor Strength (Past) vs Race Points", fontweight='bold', loc='left')
     ax.set_xlabel("Constructor Strength (past avg points)")
     ax.set_ylabel("Points")
@@ -151,10 +345,13 @@ def plot_driver_consistency_vs_points(
     fig_dir: Path,
     filename: str = "eda_driver_consistency_vs_points.png",
 ) -> Path:
-    fig, ax = plt.subplots(figsize=(10, 5))
-    x = df["driver_consistency_past"].astype(float)
-    y = df["points"].astype(float)
-    ax.scatter(x, y, alpha=0.3, s=40, color=F1_RED, edgecolors='white', linewidth=0.5)
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
+    x = df["driver_consistency_past"].to_numpy()
+    y = df["points"].to_numpy()
+    if len(x) > DENSE_SCATTER_THRESHOLD:
+        _dense_scatter(ax, x, y)
+    else:
+        _fast_scatter(ax, x, y)
     ax.set_title("Driver Consistency (Past) vs Race Points", fontweight='bold', loc='left')
     ax.set_xlabel("Driver Consistency (past std of finish position)")
     ax.set_ylabel("Points")
@@ -172,15 +369,13 @@ def plot_top_constructors_avg_points(df: pd.DataFrame, fig_dir: Path, top_n: int
     else:
         raise KeyError("No constructor column found.")
 
-    tmp = (
-        df.groupby(col, as_index=False)["points"]
-          .mean()
-          .sort_values("points", ascending=False)
-          .head(top_n)
-    )
+    #categorical key: the groupby hashes small integer codes instead of
+    #strings, and nlargest keeps a top_n heap instead of a full sort
+    key = df[col] if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col].astype("category")
+    avg = df.groupby(key, observed=True)["points"].mean().nlargest(top_n)
 
-    fig, ax = plt.subplots(figsize=(11, 5))
-    ax.bar(tmp[col].astype(str), tmp["points"], color=F1_RED, edgecolor=F1_DARK)
+    fig, ax = plt.subplots(figsize=(11, 5), layout="constrained")
+    ax.bar(avg.index.astype(str), avg.values, color=F1_RED, edgecolor=F1_DARK)
     ax.set_title(f"Top {top_n} Constructors by Average Points (2018–2024)", fontweight='bold', loc='left')
     ax.set_xlabel("Constructor")
     ax.set_ylabel("Average Points")
@@ -190,29 +385,27 @@ def plot_top_constructors_avg_points(df: pd.DataFrame, fig_dir: Path, top_n: int
 
 def plot_top_drivers_avg_points(df: pd.DataFrame, fig_dir: Path, top_n: int = 15,
                                 filename: str = "eda_top15_drivers_avg_points.png") -> Path:
+    #no df.copy(): the composed label rides along via assign (new frame,
+    #shared column blocks) or we group straight on an existing column
+    label_col = "driverName"
     if "driverName" in df.columns:
-        label_col = "driverName"
-        tmp = df.copy()
+        tmp = df
     elif "givenName" in df.columns and "familyName" in df.columns:
-        tmp = df.copy()
-        tmp["driverName"] = tmp["givenName"].astype(str) + " " + tmp["familyName"].astype(str)
-        label_col = "driverName"
+        tmp = df.assign(driverName=df["givenName"].str.cat(df["familyName"], sep=" "))
     elif "driverRef" in df.columns:
         label_col = "driverRef"
-        tmp = df.copy()
+        tmp = df
     else:
         label_col = "driverId"
-        tmp = df.copy()
+        tmp = df
 
-    stats = (
-        tmp.groupby(label_col, as_index=False)["points"]
-           .mean()
-           .sort_values("points", ascending=False)
-           .head(top_n)
-    )
+    key = tmp[label_col]
+    if not isinstance(key.dtype, pd.CategoricalDtype):
+        key = key.astype("category")
+    stats = tmp.groupby(key, observed=True)["points"].mean().nlargest(top_n)
 
-    fig, ax = plt.subplots(figsize=(12, 5))
-    ax.bar(stats[label_col].astype(str), stats["points"], color=F1_RED, edgecolor=F1_DARK)
+    fig, ax = plt.subplots(figsize=(12, 5), layout="constrained")
+    ax.bar(stats.index.astype(str), stats.values, color=F1_RED, edgecolor=F1_DARK)
     ax.set_title(f"Top {top_n} Drivers by Average Points (2018–2024)", fontweight='bold', loc='left')
     ax.set_xlabel("Driver")
     ax.set_ylabel("Average Points")
@@ -220,6 +413,31 @@ def plot_top_drivers_avg_points(df: pd.DataFrame, fig_dir: Path, top_n: int = 15
     ax.grid(axis='y', alpha=0.3)
     return save_fig(fig, fig_dir, filename)
 
+#the heatmap and the bar chart are drawn back to back on the same frame,
+#so the O(rows * cols^2) corr() is computed once and shared
+_CORR_CACHE: dict = {}
+_CORR_CACHE_MAX = 4
+
+def _numeric_corr(df: pd.DataFrame) -> pd.DataFrame:
+    """Full correlation matrix of df's numeric columns, memoized per frame."""
+    #select_dtypes already returns a new frame and corr() never writes to
+    #it, so no defensive .copy()
+    num = df.select_dtypes(include=["number"])
+    key = (id(df), df.shape, tuple(num.columns))
+    entry = _CORR_CACHE.get(key)
+    if entry is not None:
+        #the weakref guards against id() reuse: a collected frame's address
+        #can be recycled by a new frame with the same shape and columns
+        ref, cached = entry
+        if ref() is df:
+            return cached
+        del _CORR_CACHE[key]
+    corr = num.corr(numeric_only=True)
+    if len(_CORR_CACHE) >= _CORR_CACHE_MAX:
+        _CORR_CACHE.pop(next(iter(_CORR_CACHE)))
+    _CORR_CACHE[key] = (weakref.ref(df), corr)
+    return corr
+
 def plot_corr_heatmap_top_features(
     df: pd.DataFrame,
     fig_dir: Path,
@@ -227,30 +445,31 @@ def plot_corr_heatmap_top_features(
     top_k: int = 10,
     filename: str = "eda_corr_heatmap_top_features.png",
 ) -> Path:
-    num = df.select_dtypes(include=["number"]).copy()
-    if target not in num.columns:
+    full = _numeric_corr(df)
+    if target not in full.columns:
         raise ValueError(f"Target column '{target}' not found.")
 
-    corrs = num.corr(numeric_only=True)[target].drop(index=target).abs().sort_values(ascending=False)
+    corrs = full[target].drop(index=target).abs().sort_values(ascending=False)
     top_features = [target] + corrs.head(top_k).index.tolist()
-    corr_mat = num[top_features].corr(numeric_only=True).values
+    #the top-k submatrix is just a slice of the full matrix - no second corr()
+    corr_mat = full.loc[top_features, top_features].values
     labels = top_features
 
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = plt.subplots(figsize=(10, 7), layout="constrained")
     
-    cmap_f1 = mcolors.LinearSegmentedColormap.from_list("f1_heatmap", [F1_DARK, F1_WHITE, F1_RED])
-    im = ax.imshow(corr_mat, vmin=-1, vmax=1, cmap=cmap_f1)
+    im = ax.imshow(corr_mat, vmin=-1, vmax=1, cmap=F1_CMAP)
 
     ax.set_xticks(range(len(labels)))
     ax.set_yticks(range(len(labels)))
     ax.set_xticklabels(labels, rotation=45, ha="right")
     ax.set_yticklabels(labels)
 
-    for i in range(len(labels)):
-        for j in range(len(labels)):
-            
-            text_color = "white" if abs(corr_mat[i, j]) > 0.6 else "black"
-            ax.text(j, i, f"{corr_mat[i, j]:.2f}", ha="center", va="center", fontsize=9, color=text_color)
+    #format all cell strings and pick all colors in two vectorized calls;
+    #the loop only does the unavoidable ax.text placements
+    texts = np.char.mod("%.2f", corr_mat)
+    colors = np.where(np.abs(corr_mat) > 0.6, "white", "black")
+    for (i, j), label in np.ndenumerate(texts):
+        ax.text(j, i, label, ha="center", va="center", fontsize=9, color=colors[i, j])
 
     ax.set_title("Correlation Heatmap (Top Features vs Points)", fontweight='bold', loc='left')
     fig.colorbar(im, ax=ax, shrink=0.8, label="Correlation")
@@ -262,10 +481,9 @@ def plot_corr_with_points_bar(
     target: str = "points",
     filename: str = "eda_corr_with_points_bar.png",
 ) -> Path:
-    num = df.select_dtypes(include=["number"]).copy()
-    corr = num.corr(numeric_only=True)[target].drop(index=target).sort_values()
+    corr = _numeric_corr(df)[target].drop(index=target).sort_values()
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
     ax.barh(corr.index.astype(str), corr.values, color=F1_RED, edgecolor=F1_DARK)
     ax.set_title("Correlation of Features with Race Points", fontweight='bold', loc='left')
     ax.set_xlabel("Correlation with Points")
@@ -285,35 +503,29 @@ def plot_pole_win_rate_selected_gps(
         raise KeyError("No race name column found.")
 
     tmp = df[df[race_col].isin(gps)].copy()
-    tmp["from_pole"] = tmp["grid_clean"] == 1
-    tmp["won"] = tmp["positionOrder"] == 1
-
-    rates = []
-    labels = []
-    for gp in gps:
-        sub = tmp[tmp[race_col] == gp]
-        pole = sub[sub["from_pole"]]
-        poles = len(pole)
-        wins = int(pole["won"].sum()) if poles else 0
-        rate = (wins / poles) if poles else np.nan
-        rates.append(rate)
-        labels.append(gp)
-
-    fig, ax = plt.subplots(figsize=(10, 5))
+    #int8 flags + one grouped sum replace the per-GP filter/slice loop.
+    #fillna(False): on nullable pipeline output (Int32 grid_clean with NA
+    #for pit-lane starts) the comparison yields NA, which int8 rejects
+    tmp["pole"] = (tmp["grid_clean"] == 1).fillna(False).astype("int8")
+    tmp["pole_win"] = ((tmp["pole"] == 1) & (tmp["positionOrder"] == 1)).fillna(False).astype("int8")
+
+    stats = tmp.groupby(race_col, observed=True)[["pole", "pole_win"]].sum().reindex(gps)
+    rates = (stats["pole_win"] / stats["pole"].replace(0, np.nan)).to_numpy()
+    labels = list(gps)
+
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
     ax.bar(labels, rates, color=F1_RED, edgecolor=F1_DARK)
     ax.set_title("Win Rate from Pole (2018–2024): Monaco vs Monza vs Spa", fontweight='bold', loc='left')
     ax.set_xlabel("Grand Prix")
     ax.set_ylabel("Win Rate from Pole (P1→P1)")
     ax.set_ylim(0, 1.1)
 
+    #the annotation counts are already in stats - no re-filtering of tmp
+    poles = stats["pole"].to_numpy()
+    wins = stats["pole_win"].to_numpy()
     for i, r in enumerate(rates):
         if not np.isnan(r):
-            gp = labels[i]
-            sub = tmp[tmp[race_col] == gp]
-            pole = sub[sub["from_pole"]]
-            poles = len(pole)
-            wins = int(pole["won"].sum())
-            ax.text(i, r + 0.02, f"{wins}/{poles} ({r*100:.1f}%)", 
+            ax.text(i, r + 0.02, f"{int(wins[i])}/{int(poles[i])} ({r*100:.1f}%)",
                     ha="center", va="bottom", fontsize=10, fontweight='bold', color=F1_DARK)
 
     plt.setp(ax.get_xticklabels(), rotation=20, ha="right")